@@ -10,6 +10,7 @@ from agents.schemas import (
 from agents.scout import fetch_scout_report
 from agents.analyst import generate_bear_memo, generate_bull_memo
 from agents.synthesizer import synthesize
+from agents.orchestrator import run_pipeline
 
 __all__ = [
     "FinancialMetrics",
@@ -22,4 +23,5 @@ __all__ = [
     "generate_bear_memo",
     "generate_bull_memo",
     "synthesize",
+    "run_pipeline",
 ]
@@ -1,11 +1,13 @@
 """Munger & Buffett Analyst Agents: Generate perspective-specific memos using LLM."""
 
+from collections.abc import Callable
 from typing import Literal
 
-from google import genai
 from google.genai import types
+from pydantic import ValidationError
 
-from config import GEMINI_API_KEY, GEMINI_MODEL
+from config import GEMINI_MODEL
+from agents.llm import get_client
 from agents.schemas import AnalystMemo, ScoutReport
 
 
@@ -20,11 +22,38 @@ Analyze the following stock data with a focus on LONG-TERM VALUE.
 Focus on: durable competitive advantages (moats), brand power, pricing power, compounding potential, management quality, margin of safety.
 Be realistic but identify genuine strengths."""
 
+MEMO_INSTRUCTIONS = """Respond with a JSON object containing:
+- summary: 3-4 sentence summary (max 500 chars)
+- key_points: list of 3-5 bullet points
+- risk_reward_assessment: your risk/reward analysis (max 300 chars)
+- confidence_in_thesis: float between 0.0 and 1.0"""
+
+
+# Static conversation turns are built once; only the final user turn varies per request
+_ACKNOWLEDGEMENT = types.Content(
+    role="model",
+    parts=[types.Part(text="I understand. I will analyze the stock data you provide with my perspective and return a structured JSON memo.")],
+)
+_MUNGER_PREAMBLE = (
+    types.Content(role="user", parts=[types.Part(text=MUNGER_SYSTEM_PROMPT)]),
+    _ACKNOWLEDGEMENT,
+)
+_BUFFETT_PREAMBLE = (
+    types.Content(role="user", parts=[types.Part(text=BUFFETT_SYSTEM_PROMPT)]),
+    _ACKNOWLEDGEMENT,
+)
+
+
+# JSON schema is generated once here; passing the model class as
+# response_schema would make the SDK regenerate and convert it on every call
+_MEMO_JSON_SCHEMA = AnalystMemo.model_json_schema()
+
 
 def _generate_memo(
     report: ScoutReport,
     perspective: Literal["bear", "bull"],
-    system_prompt: str,
+    preamble: tuple[types.Content, ...],
+    on_text: Callable[[str], None] | None = None,
 ) -> AnalystMemo:
     """
     Internal helper to generate an analyst memo using Gemini.
@@ -32,7 +61,8 @@ def _generate_memo(
     Args:
         report: ScoutReport with financial metrics and news
         perspective: "bear" or "bull"
-        system_prompt: Persona-specific system prompt
+        preamble: Persona system prompt and model acknowledgement turns
+        on_text: Called with each chunk of raw response text as it streams in
 
     Returns:
         AnalystMemo with the LLM's analysis
@@ -40,40 +70,45 @@ def _generate_memo(
     Raises:
         RuntimeError: If LLM call fails or returns invalid response
     """
-    client = genai.Client(api_key=GEMINI_API_KEY)
+    client = get_client()
 
     user_prompt = f"""Analyze this stock and produce your investment memo.
 
 STOCK DATA:
-{report.model_dump_json(indent=2)}
+{report.prompt_json}
 
-Respond with a JSON object containing:
-- summary: 3-4 sentence summary (max 500 chars)
-- key_points: list of 3-5 bullet points
-- risk_reward_assessment: your risk/reward analysis (max 300 chars)
-- confidence_in_thesis: float between 0.0 and 1.0"""
+{MEMO_INSTRUCTIONS}"""
 
+    chunks: list[str] = []
     try:
-        response = client.models.generate_content(
+        stream = client.models.generate_content_stream(
             model=GEMINI_MODEL,
             contents=[
-                types.Content(role="user", parts=[types.Part(text=system_prompt)]),
-                types.Content(role="model", parts=[types.Part(text="I understand. I will analyze the stock data you provide with my perspective and return a structured JSON memo.")]),
+                *preamble,
                 types.Content(role="user", parts=[types.Part(text=user_prompt)]),
             ],
             config=types.GenerateContentConfig(
                 response_mime_type="application/json",
-                response_schema=AnalystMemo,
+                response_json_schema=_MEMO_JSON_SCHEMA,
                 temperature=0.7,
             ),
         )
+        for chunk in stream:
+            if chunk.text:
+                chunks.append(chunk.text)
+                if on_text is not None:
+                    on_text(chunk.text)
     except Exception as e:
         raise RuntimeError(f"Gemini API call failed: {e}") from e
 
-    if response.parsed is None:
+    if not chunks:
         raise RuntimeError(f"Gemini returned invalid response for {perspective} memo")
 
-    memo: AnalystMemo = response.parsed
+    # Partial chunks are not valid JSON; parse and validate the full text in one pass
+    try:
+        memo = AnalystMemo.model_validate_json("".join(chunks))
+    except ValidationError as e:
+        raise RuntimeError(f"Gemini returned invalid response for {perspective} memo: {e}") from e
 
     # Override perspective and ticker to ensure correctness (don't trust LLM)
     memo.perspective = perspective
@@ -82,27 +117,35 @@ Respond with a JSON object containing:
     return memo
 
 
-def generate_bear_memo(report: ScoutReport) -> AnalystMemo:
+def generate_bear_memo(
+    report: ScoutReport,
+    on_text: Callable[[str], None] | None = None,
+) -> AnalystMemo:
     """
     Generate a bearish (Munger-style) investment memo.
 
     Args:
         report: ScoutReport with financial metrics and news
+        on_text: Optional callback receiving streamed response text
 
     Returns:
         AnalystMemo with perspective="bear"
     """
-    return _generate_memo(report, "bear", MUNGER_SYSTEM_PROMPT)
+    return _generate_memo(report, "bear", _MUNGER_PREAMBLE, on_text)
 
 
-def generate_bull_memo(report: ScoutReport) -> AnalystMemo:
+def generate_bull_memo(
+    report: ScoutReport,
+    on_text: Callable[[str], None] | None = None,
+) -> AnalystMemo:
     """
     Generate a bullish (Buffett-style) investment memo.
 
     Args:
         report: ScoutReport with financial metrics and news
+        on_text: Optional callback receiving streamed response text
 
     Returns:
         AnalystMemo with perspective="bull"
     """
-    return _generate_memo(report, "bull", BUFFETT_SYSTEM_PROMPT)
+    return _generate_memo(report, "bull", _BUFFETT_PREAMBLE, on_text)
@@ -0,0 +1,64 @@
+"""Disk cache: persist agent outputs as single-row Parquet files with per-namespace TTLs."""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import CACHE_DIR
+
+
+def get(namespace: str, key: str, ttl: float) -> tuple[dict, float] | None:
+    """
+    Load the newest cached record for a key if it is younger than ttl.
+
+    Args:
+        namespace: Cache subdirectory (e.g., "scout")
+        key: Record key (e.g., an uppercased ticker)
+        ttl: Maximum age in seconds
+
+    Returns:
+        Tuple of (record, write time as a time.time() timestamp), or None on a
+        miss, an expired entry or an unreadable file
+    """
+    # Files are named {key}_{YYYYMMDD_HH}, so the newest snapshot sorts last
+    snapshots = sorted((CACHE_DIR / namespace).glob(f"{key}_*.parquet"))
+    if not snapshots:
+        return None
+
+    path = snapshots[-1]
+    try:
+        written_at = path.stat().st_mtime
+        if time.time() - written_at > ttl:
+            return None
+        return pq.read_table(path).to_pylist()[0], written_at
+    except (OSError, IndexError, pa.ArrowException):
+        return None
+
+
+def put(namespace: str, key: str, record: dict) -> None:
+    """
+    Store a record as the current hour's snapshot for a key.
+
+    Older snapshots are kept so past analyses can be reproduced. Write
+    failures are ignored since the cache is only an optimization.
+
+    Args:
+        namespace: Cache subdirectory (e.g., "scout")
+        key: Record key (e.g., an uppercased ticker)
+        record: JSON-compatible dict, e.g. from model_dump()
+    """
+    directory = CACHE_DIR / namespace
+    path = directory / f"{key}_{datetime.now():%Y%m%d_%H}.parquet"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.Table.from_pylist([record]), tmp_path)
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except (OSError, pa.ArrowException):
+        Path(tmp_path).unlink(missing_ok=True)
@@ -0,0 +1,27 @@
+"""Shared Gemini client for the LLM-backed agents."""
+
+import threading
+
+from google import genai
+from google.genai import types
+
+from config import GEMINI_API_KEY, GEMINI_HTTP2
+
+
+_client: genai.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> genai.Client:
+    """Return the process-wide Gemini client, so every LLM call shares one connection pool."""
+    global _client
+    # The bear and bull workers make their first call at the same moment;
+    # lock so only one of them builds the client (and its connection pool)
+    with _client_lock:
+        if _client is None:
+            # Over HTTP/2 the bear, bull and synthesis requests multiplex on one TLS connection
+            _client = genai.Client(
+                api_key=GEMINI_API_KEY,
+                http_options=types.HttpOptions(client_args={"http2": GEMINI_HTTP2}),
+            )
+        return _client
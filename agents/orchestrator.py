@@ -0,0 +1,101 @@
+"""Orchestrator: run Scout, then Bear and Bull in parallel, then join in the Synthesizer."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Literal
+
+from agents.analyst import generate_bear_memo, generate_bull_memo
+from agents.schemas import AnalystMemo, FinalRecommendation, ScoutReport
+from agents.scout import fetch_scout_report
+from agents.synthesizer import synthesize
+
+
+Stage = Literal["scout", "bear", "bull", "synthesis"]
+
+
+async def run_pipeline(
+    ticker: str,
+    on_stage: Callable[[Stage, ScoutReport | AnalystMemo | FinalRecommendation], None] | None = None,
+    on_text: Callable[[Stage, str], None] | None = None,
+) -> tuple[ScoutReport, FinalRecommendation]:
+    """
+    Run the full analysis pipeline for a ticker.
+
+    The blocking agents run in worker threads: the scout report is fetched
+    first, the bear and bull memos are generated concurrently, and synthesis
+    starts as soon as both memos have landed. Callbacks are always invoked on
+    the event loop's thread, so UI code can call them safely, and anything
+    they raise propagates out of run_pipeline.
+
+    Args:
+        ticker: Stock ticker symbol (e.g., "AAPL")
+        on_stage: Called with the stage name and its output when a stage finishes
+        on_text: Called with the stage name and each chunk of streamed LLM text
+
+    Returns:
+        Tuple of (ScoutReport, FinalRecommendation)
+
+    Raises:
+        ValueError: If ticker is invalid or essential data is missing
+        RuntimeError: If an LLM call fails or returns invalid response
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    failed = False
+    callback_error: BaseException | None = None
+
+    def forward(stage: Stage, text: str) -> None:
+        nonlocal callback_error
+        # After one memo fails its sibling keeps running until asyncio.run
+        # shuts down the executor; stop surfacing its output
+        if failed or callback_error is not None:
+            return
+        try:
+            on_text(stage, text)
+        except BaseException as e:
+            # asyncio would log and drop an error raised in a loop callback (e.g.
+            # Streamlit's rerun request); cancel the pipeline and re-raise it there
+            callback_error = e
+            task.cancel()
+
+    def stream(stage: Stage) -> Callable[[str], None] | None:
+        if on_text is None:
+            return None
+        # Agents stream from worker threads; hop back onto the loop's thread
+        return lambda text: loop.call_soon_threadsafe(forward, stage, text)
+
+    def finish(stage: Stage, result: ScoutReport | AnalystMemo | FinalRecommendation) -> None:
+        if on_stage is not None:
+            on_stage(stage, result)
+
+    async def memo(
+        stage: Literal["bear", "bull"],
+        generate: Callable[..., AnalystMemo],
+    ) -> AnalystMemo:
+        result = await asyncio.to_thread(generate, report, stream(stage))
+        finish(stage, result)
+        return result
+
+    try:
+        report = await asyncio.to_thread(fetch_scout_report, ticker)
+        finish("scout", report)
+
+        try:
+            bear, bull = await asyncio.gather(
+                memo("bear", generate_bear_memo),
+                memo("bull", generate_bull_memo),
+            )
+        except Exception:
+            failed = True
+            raise
+
+        final = await asyncio.to_thread(
+            synthesize, bull, bear, report.metrics, stream("synthesis")
+        )
+        finish("synthesis", final)
+    except asyncio.CancelledError:
+        if callback_error is not None:
+            raise callback_error from None
+        raise
+
+    return report, final
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 from typing import Literal
 
@@ -36,6 +38,15 @@ class ScoutReport(BaseModel):
     headlines: list[NewsHeadline]
     fetch_timestamp: str
 
+    @cached_property
+    def prompt_json(self) -> str:
+        """
+        Compact JSON for LLM prompts, serialized once and shared by every stage.
+
+        Headline links are dropped: the model cannot follow them and they only add tokens.
+        """
+        return self.model_dump_json(exclude={"headlines": {"__all__": {"link"}}})
+
 
 class AnalystMemo(BaseModel):
     """Output of Munger/Buffett Agents."""
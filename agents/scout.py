@@ -1,17 +1,48 @@
 """Scout Agent: fetches raw financial data and news headlines."""
 
+import math
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
 import yfinance as yf
+from pydantic import TypeAdapter, ValidationError
 
-from config import MAX_HEADLINES
+from config import MAX_HEADLINES, SCOUT_CACHE_TTL, SCOUT_DISK_CACHE_TTL
+from agents import cache
 from agents.schemas import FinancialMetrics, NewsHeadline, ScoutReport
 
 
+_REPORT_CACHE_MAX_SIZE = 256
+
+# Yahoo symbols: optional "^" for indices, then letters/digits with ".", "-" or "="
+# (e.g., AAPL, BRK-B, 0700.HK, ^GSPC, EURUSD=X)
+_TICKER_RE = re.compile(r"\^?[A-Z0-9][A-Z0-9.\-=]{0,11}")
+
+# Validates the whole headline list in one pass instead of one model call per item
+_HEADLINES_ADAPTER = TypeAdapter(list[NewsHeadline])
+
+# Uppercased ticker -> (time.monotonic() at which the entry expires, report)
+_report_cache: dict[str, tuple[float, ScoutReport]] = {}
+
+# Uppercased ticker -> pending fetch, so concurrent sessions share one yfinance call
+_inflight: dict[str, Future[ScoutReport]] = {}
+
+# Guards both _report_cache and _inflight
+_cache_lock = threading.Lock()
+
+
 def fetch_scout_report(ticker: str) -> ScoutReport:
     """
     Fetch financial metrics and news headlines for a ticker.
 
+    Reports are reused for SCOUT_CACHE_TTL seconds in memory and
+    SCOUT_DISK_CACHE_TTL seconds on disk so re-analyzing the same ticker does
+    not hit yfinance again, and concurrent requests for the same ticker wait
+    on a single in-flight fetch.
+
     Args:
         ticker: Stock ticker symbol (e.g., "AAPL")
 
@@ -19,17 +50,90 @@ def fetch_scout_report(ticker: str) -> ScoutReport:
         ScoutReport with metrics and headlines
 
     Raises:
-        ValueError: If ticker is invalid or essential data is missing
+        ValueError: If ticker is malformed, invalid or essential data is missing
     """
+    key = ticker.strip().upper()
+
+    # Reject garbage before any cache lookup or network I/O
+    if not _TICKER_RE.fullmatch(key):
+        raise ValueError(f"Malformed ticker: {ticker!r}")
+
+    with _cache_lock:
+        cached = _report_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+
+    if not is_owner:
+        # Another caller is already fetching this ticker; share its result (or error)
+        return future.result()
+
+    try:
+        disk_cached = _load_disk_cached_report(key)
+        if disk_cached is not None:
+            report, age = disk_cached
+        else:
+            report, age = _fetch_scout_report(key), 0.0
+            cache.put("scout", key, report.model_dump())
+    except BaseException as e:
+        with _cache_lock:
+            del _inflight[key]
+        future.set_exception(e)
+        raise
+
+    with _cache_lock:
+        # Evict the oldest entry (dicts keep insertion order) to bound memory
+        _report_cache.pop(key, None)
+        if len(_report_cache) >= _REPORT_CACHE_MAX_SIZE:
+            _report_cache.pop(next(iter(_report_cache)))
+        # A disk hit stays in memory no longer than the snapshot's own remaining TTL
+        expires_at = time.monotonic() + min(SCOUT_CACHE_TTL, SCOUT_DISK_CACHE_TTL - age)
+        _report_cache[key] = (expires_at, report)
+        del _inflight[key]
+    future.set_result(report)
+
+    return report
+
+
+def _load_disk_cached_report(ticker: str) -> tuple[ScoutReport, float] | None:
+    """Load a still-fresh ScoutReport and its age in seconds from the Parquet cache."""
+    cached = cache.get("scout", ticker, ttl=SCOUT_DISK_CACHE_TTL)
+    if cached is None:
+        return None
+    record, written_at = cached
+    try:
+        return ScoutReport.model_validate(record), max(time.time() - written_at, 0.0)
+    except ValidationError:
+        # Stale file from an older schema; refetch and overwrite it
+        return None
+
+
+def _fetch_scout_report(ticker: str) -> ScoutReport:
+    """Fetch a fresh ScoutReport from yfinance, bypassing the cache."""
     stock = yf.Ticker(ticker)
-    info = stock.info
 
-    # Validate we got real data (yfinance returns empty dict for invalid tickers)
-    if not info or info.get("regularMarketPrice") is None and info.get("currentPrice") is None:
-        raise ValueError(f"Invalid ticker or no data available for: {ticker}")
+    # info and news are independent Yahoo requests; fetch them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        info_future = executor.submit(lambda: stock.info)
+        news_future = executor.submit(lambda: stock.news or [])
+        info = info_future.result()
+        raw_news = news_future.result()
 
-    # Price fallback chain: currentPrice -> regularMarketPrice
+    # Price fallback chain: currentPrice -> regularMarketPrice -> fast_info.last_price
     current_price = info.get("currentPrice") or info.get("regularMarketPrice")
+
+    # Validate we got real data: for unknown symbols yfinance returns an empty dict
+    # or a stub like {"trailingPegRatio": None}, so fail before any fast_info request
+    if current_price is None and not (info.get("quoteType") or info.get("shortName")):
+        raise ValueError(f"Invalid ticker or no data available for: {ticker}")
+
+    if current_price is None:
+        current_price = _fast_info_value(stock, "last_price")
     if current_price is None:
         raise ValueError(f"Could not determine current price for: {ticker}")
 
@@ -38,6 +142,12 @@ def fetch_scout_report(ticker: str) -> ScoutReport:
     # Convert to actual ratio by dividing by 100
     debt_to_equity_raw = info.get("debtToEquity")
     debt_to_equity = debt_to_equity_raw / 100 if debt_to_equity_raw is not None else None
+
+    # Index and fund quotes never carry a market cap; only equities are worth the
+    # extra share-count lookup behind fast_info.market_cap
+    market_cap = info.get("marketCap")
+    if market_cap is None and info.get("quoteType") == "EQUITY":
+        market_cap = _fast_info_value(stock, "market_cap")
     
     metrics = FinancialMetrics(
         ticker=ticker.upper(),
@@ -48,28 +158,56 @@ def fetch_scout_report(ticker: str) -> ScoutReport:
         price_to_book=info.get("priceToBook"),
         debt_to_equity=debt_to_equity,
         free_cash_flow=info.get("freeCashflow"),  # Note: lowercase 'f' in yfinance
-        market_cap=info.get("marketCap"),
+        market_cap=market_cap,
         dividend_yield=info.get("dividendYield"),
-        fifty_two_week_high=info.get("fiftyTwoWeekHigh"),
-        fifty_two_week_low=info.get("fiftyTwoWeekLow"),
+        fifty_two_week_high=_info_or_fast_info(info, "fiftyTwoWeekHigh", stock, "year_high"),
+        fifty_two_week_low=_info_or_fast_info(info, "fiftyTwoWeekLow", stock, "year_low"),
         sector=info.get("sector"),
         industry=info.get("industry"),
     )
 
-    # Fetch news headlines (may be empty list)
-    raw_news = stock.news or []
-    headlines = [
-        NewsHeadline(
-            title=item.get("title", ""),
-            publisher=item.get("publisher", ""),
-            link=item.get("link"),
-        )
-        for item in raw_news[:MAX_HEADLINES]
-        if item.get("title")  # Skip items without titles
-    ]
+    # News headlines (may be empty list), deduplicated by normalized title since
+    # aggregators often syndicate the same story under several publishers
+    seen_titles: set[str] = set()
+    raw_headlines = []
+    for item in raw_news:
+        title = item.get("title")
+        if not title:  # Skip items without titles
+            continue
+        title_key = title.lower().strip()[:80]
+        if title_key in seen_titles:
+            continue
+        seen_titles.add(title_key)
+        raw_headlines.append({
+            "title": title,
+            "publisher": item.get("publisher", ""),
+            "link": item.get("link"),
+        })
+        if len(raw_headlines) == MAX_HEADLINES:
+            break
+    headlines = _HEADLINES_ADAPTER.validate_python(raw_headlines)
 
     return ScoutReport(
         metrics=metrics,
         headlines=headlines,
         fetch_timestamp=datetime.now().isoformat(),
     )
+
+
+def _fast_info_value(stock: yf.Ticker, attr: str) -> float | None:
+    """Read a field from yfinance fast_info, returning None if it is unavailable."""
+    try:
+        value = getattr(stock.fast_info, attr)
+    except Exception:
+        return None
+    if value is None or math.isnan(value):
+        return None
+    return float(value)
+
+
+def _info_or_fast_info(info: dict, info_key: str, stock: yf.Ticker, fast_info_attr: str) -> float | None:
+    """Prefer the already-fetched info value; only hit fast_info when it is missing."""
+    value = info.get(info_key)
+    if value is not None:
+        return value
+    return _fast_info_value(stock, fast_info_attr)
@@ -1,9 +1,12 @@
 """Synthesizer Agent: Merge bear and bull memos into a final recommendation."""
 
-from google import genai
+from collections.abc import Callable
+
 from google.genai import types
+from pydantic import ValidationError
 
-from config import GEMINI_API_KEY, GEMINI_MODEL
+from config import GEMINI_MODEL
+from agents.llm import get_client
 from agents.schemas import (
     AnalystMemo,
     FinancialMetrics,
@@ -12,6 +15,10 @@ from agents.schemas import (
 )
 
 
+# Precomputed so the SDK does not rebuild the schema from the model per request
+_SYNTHESIZER_JSON_SCHEMA = SynthesizerOutput.model_json_schema()
+
+
 SYNTHESIZER_SYSTEM_PROMPT = """You are a senior investment committee synthesizing two analyst reports.
 Your job is to weigh both perspectives and produce a balanced final recommendation.
 
@@ -21,11 +28,26 @@ CRITICAL INSTRUCTIONS:
 - STRONG_BUY/STRONG_SELL require high confidence and clear evidence.
 - Identify 3-5 specific caveats the investor must verify independently."""
 
+SYNTHESIZER_INSTRUCTIONS = """Respond with a JSON object containing:
+- ticker: the stock ticker
+- recommendation: one of "STRONG_BUY", "BUY", "HOLD", "SELL", "STRONG_SELL"
+- confidence_score: float between 0.0 and 1.0 (NOT a simple average—reason about which thesis is stronger)
+- synthesis_summary: balanced summary weighing both perspectives (max 600 chars)
+- key_caveats: list of 3-5 specific things the investor must verify independently"""
+
+
+# System prompt and acknowledgement never change, so build the turns once
+_SYNTHESIZER_PREAMBLE = (
+    types.Content(role="user", parts=[types.Part(text=SYNTHESIZER_SYSTEM_PROMPT)]),
+    types.Content(role="model", parts=[types.Part(text="I understand. I will carefully weigh both analyst perspectives and produce a balanced final recommendation with specific caveats.")]),
+)
+
 
 def synthesize(
     bull: AnalystMemo,
     bear: AnalystMemo,
     metrics: FinancialMetrics,
+    on_text: Callable[[str], None] | None = None,
 ) -> FinalRecommendation:
     """
     Synthesize bull and bear memos into a final recommendation.
@@ -34,6 +56,7 @@ def synthesize(
         bull: Bullish (Buffett-style) memo
         bear: Bearish (Munger-style) memo
         metrics: Current financial metrics
+        on_text: Called with each chunk of raw response text as it streams in
 
     Returns:
         FinalRecommendation with balanced analysis
@@ -41,47 +64,50 @@ def synthesize(
     Raises:
         RuntimeError: If LLM call fails or returns invalid response
     """
-    client = genai.Client(api_key=GEMINI_API_KEY)
+    client = get_client()
 
     user_prompt = f"""Synthesize these two analyst reports and produce your final recommendation.
 
 BULL MEMO (Buffett perspective):
-{bull.model_dump_json(indent=2)}
+{bull.model_dump_json()}
 
 BEAR MEMO (Munger perspective):
-{bear.model_dump_json(indent=2)}
+{bear.model_dump_json()}
 
 CURRENT METRICS:
-{metrics.model_dump_json(indent=2)}
+{metrics.model_dump_json()}
 
-Respond with a JSON object containing:
-- ticker: the stock ticker
-- recommendation: one of "STRONG_BUY", "BUY", "HOLD", "SELL", "STRONG_SELL"
-- confidence_score: float between 0.0 and 1.0 (NOT a simple average—reason about which thesis is stronger)
-- synthesis_summary: balanced summary weighing both perspectives (max 600 chars)
-- key_caveats: list of 3-5 specific things the investor must verify independently"""
+{SYNTHESIZER_INSTRUCTIONS}"""
 
+    chunks: list[str] = []
     try:
-        response = client.models.generate_content(
+        stream = client.models.generate_content_stream(
             model=GEMINI_MODEL,
             contents=[
-                types.Content(role="user", parts=[types.Part(text=SYNTHESIZER_SYSTEM_PROMPT)]),
-                types.Content(role="model", parts=[types.Part(text="I understand. I will carefully weigh both analyst perspectives and produce a balanced final recommendation with specific caveats.")]),
+                *_SYNTHESIZER_PREAMBLE,
                 types.Content(role="user", parts=[types.Part(text=user_prompt)]),
             ],
             config=types.GenerateContentConfig(
                 response_mime_type="application/json",
-                response_schema=SynthesizerOutput,
+                response_json_schema=_SYNTHESIZER_JSON_SCHEMA,
                 temperature=0.7,
             ),
         )
+        for chunk in stream:
+            if chunk.text:
+                chunks.append(chunk.text)
+                if on_text is not None:
+                    on_text(chunk.text)
     except Exception as e:
         raise RuntimeError(f"Gemini API call failed during synthesis: {e}") from e
 
-    if response.parsed is None:
+    if not chunks:
         raise RuntimeError("Gemini returned invalid response for synthesis")
 
-    synth_output: SynthesizerOutput = response.parsed
+    try:
+        synth_output = SynthesizerOutput.model_validate_json("".join(chunks))
+    except ValidationError as e:
+        raise RuntimeError(f"Gemini returned invalid response for synthesis: {e}") from e
 
     # Compose full FinalRecommendation with original memos attached
     return FinalRecommendation(
@@ -1,11 +1,34 @@
 """Streamlit UI for Munger-Buffett Analyst Swarm."""
 
+from __future__ import annotations
+
+import asyncio
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 import streamlit as st
 
-from agents.scout import fetch_scout_report
-from agents.analyst import generate_bear_memo, generate_bull_memo
-from agents.synthesizer import synthesize
-from agents.schemas import FinancialMetrics, AnalystMemo, FinalRecommendation
+# The agents pull in yfinance (pandas/numpy) and google-genai; they are imported
+# on the first Analyze click so the initial page render does not wait on them
+if TYPE_CHECKING:
+    from streamlit.delta_generator import DeltaGenerator
+
+    from agents.orchestrator import Stage
+    from agents.schemas import FinancialMetrics, AnalystMemo, FinalRecommendation, ScoutReport
+
+
+# --- Constants ---
+
+RECOMMENDATION_COLORS = MappingProxyType({
+    "STRONG_BUY": "#00C853",
+    "BUY": "#69F0AE",
+    "HOLD": "#FFD600",
+    "SELL": "#FF5252",
+    "STRONG_SELL": "#D50000",
+})
+
+# Recommendations whose badge color needs white text for contrast
+DARK_BADGE_RECOMMENDATIONS = frozenset({"STRONG_SELL", "SELL", "STRONG_BUY"})
 
 
 # --- Helper Functions ---
@@ -37,14 +60,7 @@ def format_percent(n: float | None, is_ratio: bool = False) -> str:
 
 def get_recommendation_color(rec: str) -> str:
     """Map recommendation to hex color."""
-    colors = {
-        "STRONG_BUY": "#00C853",
-        "BUY": "#69F0AE",
-        "HOLD": "#FFD600",
-        "SELL": "#FF5252",
-        "STRONG_SELL": "#D50000",
-    }
-    return colors.get(rec, "#9E9E9E")
+    return RECOMMENDATION_COLORS.get(rec, "#9E9E9E")
 
 
 def display_metrics_sidebar(metrics: FinancialMetrics, headlines: list) -> None:
@@ -90,11 +106,11 @@ def display_metrics_sidebar(metrics: FinancialMetrics, headlines: list) -> None:
     st.sidebar.divider()
     st.sidebar.header("📰 Recent Headlines")
     if headlines:
-        for h in headlines:
-            if h.link:
-                st.sidebar.markdown(f"- [{h.title}]({h.link}) *({h.publisher})*")
-            else:
-                st.sidebar.markdown(f"- {h.title} *({h.publisher})*")
+        # One markdown element for the whole list instead of one per headline
+        st.sidebar.markdown("\n".join(
+            f"- [{h.title}]({h.link}) *({h.publisher})*" if h.link else f"- {h.title} *({h.publisher})*"
+            for h in headlines
+        ))
     else:
         st.sidebar.write("No headlines available")
 
@@ -104,9 +120,7 @@ def display_memo(memo: AnalystMemo, emoji: str, label: str) -> None:
     with st.expander(f"{emoji} {label} (Confidence: {memo.confidence_in_thesis:.0%})"):
         st.markdown(f"**Summary:** {memo.summary}")
         
-        st.markdown("**Key Points:**")
-        for point in memo.key_points:
-            st.markdown(f"- {point}")
+        st.markdown("**Key Points:**\n\n" + "\n".join(f"- {point}" for point in memo.key_points))
         
         st.markdown(f"**Risk/Reward Assessment:** {memo.risk_reward_assessment}")
 
@@ -119,7 +133,7 @@ def display_results(result: FinalRecommendation) -> None:
         f"""
         <div style="
             background-color: {color};
-            color: {'white' if result.recommendation in ('STRONG_SELL', 'SELL', 'STRONG_BUY') else 'black'};
+            color: {'white' if result.recommendation in DARK_BADGE_RECOMMENDATIONS else 'black'};
             padding: 1rem 2rem;
             border-radius: 0.5rem;
             text-align: center;
@@ -143,9 +157,10 @@ def display_results(result: FinalRecommendation) -> None:
     
     # Key caveats
     st.subheader("⚠️ Key Caveats")
-    st.markdown("*Items you must verify independently:*")
-    for caveat in result.key_caveats:
-        st.markdown(f"- ⚠️ {caveat}")
+    st.markdown(
+        "*Items you must verify independently:*\n\n"
+        + "\n".join(f"- ⚠️ {caveat}" for caveat in result.key_caveats)
+    )
     
     st.divider()
     
@@ -178,27 +193,44 @@ ticker = st.text_input(
 analyze_clicked = st.button("🔍 Analyze", type="primary", disabled=not ticker)
 
 if analyze_clicked and ticker:
+    from agents.orchestrator import run_pipeline
+
     try:
         with st.status(f"Analyzing {ticker}...", expanded=True) as status:
-            # Step 1: Scout
+            # Live streamed LLM output per stage, cleared once the stage finishes
+            streams: dict[Stage, tuple[DeltaGenerator, list[str]]] = {}
+            finished: set[Stage] = set()
+
+            def on_text(stage: Stage, text: str) -> None:
+                if stage not in streams:
+                    streams[stage] = (st.empty(), [])
+                placeholder, chunks = streams[stage]
+                chunks.append(text)
+                placeholder.code("".join(chunks), language="json")
+
+            def on_stage(stage: Stage, result: ScoutReport | AnalystMemo | FinalRecommendation) -> None:
+                finished.add(stage)
+                if stage in streams:
+                    streams.pop(stage)[0].empty()
+                if stage == "scout":
+                    st.write(f"✅ Retrieved data for **{result.metrics.company_name}**")
+                    status.update(label="Generating Bear (Munger) and Bull (Buffett) memos...")
+                elif stage == "synthesis":
+                    st.write(f"✅ Synthesis complete: **{result.recommendation}**")
+                else:
+                    st.write(f"✅ {stage.title()} analysis complete (confidence: {result.confidence_in_thesis:.0%})")
+                    if {"bear", "bull"} <= finished:
+                        status.update(label="Synthesizing recommendations...")
+
+            # Scout -> Bear & Bull (concurrent) -> Synthesize
             status.update(label=f"Fetching data for {ticker}...")
-            report = fetch_scout_report(ticker)
-            st.write(f"✅ Retrieved data for **{report.metrics.company_name}**")
-            
-            # Step 2: Bear memo
-            status.update(label="Generating Bear memo (Munger)...")
-            bear_memo = generate_bear_memo(report)
-            st.write(f"✅ Bear analysis complete (confidence: {bear_memo.confidence_in_thesis:.0%})")
-            
-            # Step 3: Bull memo
-            status.update(label="Generating Bull memo (Buffett)...")
-            bull_memo = generate_bull_memo(report)
-            st.write(f"✅ Bull analysis complete (confidence: {bull_memo.confidence_in_thesis:.0%})")
-            
-            # Step 4: Synthesize
-            status.update(label="Synthesizing recommendations...")
-            final = synthesize(bull_memo, bear_memo, report.metrics)
-            st.write(f"✅ Synthesis complete: **{final.recommendation}**")
+            try:
+                report, final = asyncio.run(run_pipeline(ticker, on_stage=on_stage, on_text=on_text))
+            except Exception:
+                # A stage that never finished leaves its streamed output behind
+                for placeholder, _ in streams.values():
+                    placeholder.empty()
+                raise
             
             status.update(label="Analysis complete!", state="complete", expanded=False)
         
@@ -1,9 +1,15 @@
 import os
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = "gemini-3-pro-preview"
+GEMINI_HTTP2 = True  # multiplex concurrent Gemini calls over one connection (needs h2)
 REQUEST_TIMEOUT = 30  # seconds
 MAX_HEADLINES = 5
+SCOUT_CACHE_TTL = 300  # seconds to keep a ScoutReport in memory
+SCOUT_DISK_CACHE_TTL = 3600  # seconds to reuse a ScoutReport persisted on disk
+CACHE_DIR = Path.home() / ".kwealth" / "cache"